@@ -4,7 +4,7 @@ from .streaming import StreamClient, AsyncStreamClient
 from .forex import ForexClient
 from .crypto import CryptoClient
 from .reference_apis import ReferenceClient
-from .options import (OptionsClient, build_option_symbol, parse_option_symbol, OptionSymbol,
+from .options import (OptionsClient, build_option_symbol, parse_option_symbol, parse_option_symbols, OptionSymbol,
                       build_option_symbol_for_tda, parse_option_symbol_from_tda, convert_from_polygon_to_tda_format,
                       convert_from_tda_to_polygon_format)
 from .base_client import (BaseClient, BaseAsyncClient)
@@ -2,6 +2,7 @@
 import requests
 import httpx
 from typing import Union
+from functools import lru_cache
 from requests.models import Response
 from httpx import Response as HttpxResponse
 from enum import Enum
@@ -9,8 +10,12 @@ import os
 import datetime
 try:
     import orjson as json_lib
+    _USE_BYTES = True  # orjson decodes the raw body directly. no need to build the text first
 except ImportError:
     import json as json_lib
+    _USE_BYTES = False
+
+_loads = json_lib.loads
 
 # ========================================================= #
 
@@ -26,6 +31,15 @@ TIME_FRAME_CHUNKS = {'minute': datetime.timedelta(days=45),
                      }
 
 
+@lru_cache(maxsize=1024)
+def _parse_date_string(dt: str, _format: str = '%Y-%m-%d') -> datetime.date:
+    """
+    Parse a date string to a ``date`` object. Cached as the same date strings are normalized over and over in full
+    range aggregate calls. ``date`` objects are immutable, so sharing them is safe.
+    """
+    return datetime.datetime.strptime(dt, _format).date()
+
+
 # ========================================================= #
 
 
@@ -140,7 +154,7 @@ class Base:
                 return dt.strftime(_format)
 
         if isinstance(dt, str):
-            dt = datetime.datetime.strptime(dt, _format).date()
+            dt = _parse_date_string(dt, _format)
 
         if isinstance(dt, datetime.date):
             if output_type == 'ts' and _dir == 'start':
@@ -169,6 +183,17 @@ class Base:
             elif output_type == 'date':
                 return dt.date()
 
+    @staticmethod
+    def _decode(_res, _loads=_loads, _use_bytes=_USE_BYTES):
+        """
+        Internal helper to json decode the body of a response. orjson is fed the raw bytes while the stdlib json
+        fallback gets the decoded text.
+
+        :param _res: The response object (``requests`` or ``httpx``)
+        :return: The json decoded data
+        """
+        return _loads(_res.content) if _use_bytes else _loads(_res.text)
+
     @staticmethod
     def _change_enum(val: Union[str, Enum, float, int], allowed_type=str):
         if isinstance(val, Enum):
@@ -222,6 +247,12 @@ class BaseClient(Base):
         self.time_out_conf = (connect_timeout, read_timeout)
         self.session = requests.session()
 
+        # size the pool to the default full range worker count (never below the requests default) so those threads
+        # reuse their connections instead of re-doing the TLS handshake. a larger max_concurrent_workers passed by the
+        # caller can still outgrow the pool
+        _pool_size = max(requests.adapters.DEFAULT_POOLSIZE, (os.cpu_count() or 1) * 5)
+        self.session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=_pool_size))
+
         self.session.headers.update({'Authorization': f'Bearer {self.KEY}'})
 
     # Context Managers
@@ -256,7 +287,7 @@ class BaseClient(Base):
         if raw_response:
             return _res
 
-        return json_lib.loads(_res.text)
+        return self._decode(_res)
 
     def get_page_by_url(self, url: str, raw_response: bool = False) -> Union[Response, dict]:
         """
@@ -275,7 +306,7 @@ class BaseClient(Base):
         if raw_response:
             return _res
 
-        return json_lib.loads(_res.text)
+        return self._decode(_res)
 
     def get_next_page(self, old_response: Union[Response, dict],
                       raw_response: bool = False) -> Union[Response, dict, bool]:
@@ -347,7 +378,19 @@ class BaseClient(Base):
                  ``raw_response``
         """
 
-        direction, container, _res = self._change_enum(direction, str), [], old_response
+        return list(self._iter_pages(old_response, max_pages, direction, verbose, raw_responses))
+
+    def _iter_pages(self, old_response, max_pages: int = None, direction: str = 'next', verbose: bool = False,
+                    raw_responses: bool = False):
+        """
+        Internal generator behind ``get_all_pages``. Yields the pages one at a time so callers merging the results
+        don't have to hold on to every page. Each page is decoded once and the decoded data is used to look up the
+        following page.
+
+        Takes the same arguments as ``get_all_pages``.
+        """
+
+        direction, count, _res = self._change_enum(direction, str), 0, old_response
         if not max_pages:
             if verbose:
                 print(f'No max limit specified. Initiating pagination for ALL available pages...')
@@ -360,7 +403,7 @@ class BaseClient(Base):
 
         # Start paginating
         while 1:
-            if len(container) >= max_pages:
+            if count >= max_pages:
                 if verbose:
                     print(f'Max number of pages ({max_pages}) reached. Stopping and aggregating results...')
                 break
@@ -373,15 +416,17 @@ class BaseClient(Base):
                 break
 
             if verbose:
-                print(f'Fetched another page... total pages so far: {len(container)}')
+                print(f'Fetched another page... total pages so far: {count}')
+
+            count += 1
 
             if raw_responses:
-                container.append(_res)
+                yield _res
                 continue
 
-            container.append(json_lib.loads(_res.text))
+            _res = self._decode(_res)  # the next lookup reads next_url from the decoded page. no second decode
 
-        return container
+            yield _res
 
     def _paginate(self, _res, merge_all_pages: bool = True, max_pages: int = None, verbose: bool = False,
                   raw_page_responses: bool = False):
@@ -401,25 +446,27 @@ class BaseClient(Base):
             max_pages -= 1
 
         # How many pages do you want?? YES!!!
-        if merge_all_pages:  # prepare for a merge
-            pages = [json_lib.loads(_res.text)] + self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
-        elif raw_page_responses:  # we don't need your help, adventurer (no merge, no decoding)
+        if raw_page_responses and not merge_all_pages:  # we don't need your help, adventurer (no merge, no decoding)
             return [_res] + self.get_all_pages(_res, raw_responses=True, max_pages=max_pages, verbose=verbose)
-        else:  # okay a little bit of help is fine  (no merge, only decoding)
-            return [json_lib.loads(_res.text)] + self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
 
-        # We need your help adventurer  (decode and merge)
-        container = []
-        try:
-            for page in pages:
-                container += page['results']
-        except KeyError:
-            return pages
+        _first = self._decode(_res)
+
+        if not merge_all_pages:  # okay a little bit of help is fine  (no merge, only decoding)
+            return [_first] + self.get_all_pages(_first, max_pages=max_pages, verbose=verbose)
+
+        if 'results' not in _first:  # nothing to merge on this endpoint
+            return [_first] + self.get_all_pages(_first, max_pages=max_pages, verbose=verbose)
+
+        # We need your help adventurer  (decode and merge). pages are dropped as soon as their results are merged
+        container = _first['results']
+
+        for page in self._iter_pages(_first, max_pages=max_pages, verbose=verbose):
+            container.extend(page.get('results') or ())
 
         return container
 
     def get_full_range_aggregates(self, fn, symbol: str, time_chunks: list, run_parallel: bool = True,
-                                  max_concurrent_workers: int = os.cpu_count() * 5, warnings: bool = True,
+                                  max_concurrent_workers: int = None, warnings: bool = True,
                                   adjusted: bool = True, sort='asc', limit: int = 5000,
                                   multiplier: int = 1, timespan='day') -> list:
         """
@@ -467,13 +514,18 @@ class BaseClient(Base):
         if run_parallel:
             from concurrent.futures import ThreadPoolExecutor
 
+            if max_concurrent_workers is None:  # resolved per call so the live cpu count is respected
+                max_concurrent_workers = (os.cpu_count() or 1) * 5
+
             sort_order = self._change_enum(sort)
             futures = []
 
-            with ThreadPoolExecutor(max_workers=max_concurrent_workers) as pool:
+            _nd = self.normalize_datetime
+
+            # never spawn more threads than there are chunks to fetch
+            with ThreadPoolExecutor(max_workers=max(1, min(max_concurrent_workers, len(time_chunks)))) as pool:
                 for chunk in time_chunks:
-                    chunk = (self.normalize_datetime(chunk[0], 'nts'),
-                             self.normalize_datetime(chunk[1], 'nts', _dir='end'))
+                    chunk = (_nd(chunk[0], 'nts'), _nd(chunk[1], 'nts', _dir='end'))
                     futures.append(pool.submit(fn, symbol, chunk[0], chunk[1], adjusted=adjusted, sort='asc',
                                                limit=500000, multiplier=multiplier, timespan=timespan))
 
@@ -643,7 +695,7 @@ class BaseAsyncClient(Base):
         if raw_response:
             return _res
 
-        return json_lib.loads(_res.text)
+        return self._decode(_res)
 
     async def get_page_by_url(self, url: str, raw_response: bool = False) -> Union[HttpxResponse, dict]:
         """
@@ -662,7 +714,7 @@ class BaseAsyncClient(Base):
         if raw_response:
             return _res
 
-        return json_lib.loads(_res.text)
+        return self._decode(_res)
 
     async def get_next_page(self, old_response: Union[HttpxResponse, dict],
                             raw_response: bool = False) -> Union[HttpxResponse, dict, bool]:
@@ -735,7 +787,19 @@ class BaseAsyncClient(Base):
                  ``raw_response``
         """
 
-        direction, container, _res = self._change_enum(direction, str), [], old_response
+        return [page async for page in self._iter_pages(old_response, max_pages, direction, verbose, raw_responses)]
+
+    async def _iter_pages(self, old_response, max_pages: int = None, direction: str = 'next',
+                          verbose: bool = False, raw_responses: bool = False):
+        """
+        Internal generator behind ``get_all_pages``. Yields the pages one at a time so callers merging the results
+        don't have to hold on to every page. Each page is decoded once and the decoded data is used to look up the
+        following page.
+
+        Takes the same arguments as ``get_all_pages``.
+        """
+
+        direction, count, _res = self._change_enum(direction, str), 0, old_response
         if not max_pages:
             if verbose:
                 print(f'No max limit specified. Initiating pagination for ALL available pages...')
@@ -748,7 +812,7 @@ class BaseAsyncClient(Base):
 
         # Start paginating
         while 1:
-            if len(container) >= max_pages:
+            if count >= max_pages:
                 if verbose:
                     print(f'Max number of pages ({max_pages}) reached. Stopping and aggregating results...')
                 break
@@ -761,15 +825,17 @@ class BaseAsyncClient(Base):
                 break
 
             if verbose:
-                print(f'Fetched another page... total pages so far: {len(container)}')
+                print(f'Fetched another page... total pages so far: {count}')
+
+            count += 1
 
             if raw_responses:
-                container.append(_res)
+                yield _res
                 continue
 
-            container.append(json_lib.loads(_res.text))
+            _res = self._decode(_res)  # the next lookup reads next_url from the decoded page. no second decode
 
-        return container
+            yield _res
 
     async def _paginate(self, _res, merge_all_pages: bool = True, max_pages: int = None, verbose: bool = False,
                         raw_page_responses: bool = False):
@@ -789,25 +855,27 @@ class BaseAsyncClient(Base):
             max_pages -= 1
 
         # How many pages do you want?? YES!!!
-        if merge_all_pages:  # prepare for a merge
-            pages = [json_lib.loads(_res.text)] + await self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
-        elif raw_page_responses:  # we don't need your help, adventurer (no merge, no decoding)
+        if raw_page_responses and not merge_all_pages:  # we don't need your help, adventurer (no merge, no decoding)
             return [_res] + await self.get_all_pages(_res, raw_responses=True, max_pages=max_pages, verbose=verbose)
-        else:  # okay a little bit of help is fine  (no merge, only decoding)
-            return [json_lib.loads(_res.text)] + await self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
 
-        # We need your help adventurer  (decode and merge)
-        container = []
-        try:
-            for page in pages:
-                container += page['results']
-        except KeyError:
-            return pages
+        _first = self._decode(_res)
+
+        if not merge_all_pages:  # okay a little bit of help is fine  (no merge, only decoding)
+            return [_first] + await self.get_all_pages(_first, max_pages=max_pages, verbose=verbose)
+
+        if 'results' not in _first:  # nothing to merge on this endpoint
+            return [_first] + await self.get_all_pages(_first, max_pages=max_pages, verbose=verbose)
+
+        # We need your help adventurer  (decode and merge). pages are dropped as soon as their results are merged
+        container = _first['results']
+
+        async for page in self._iter_pages(_first, max_pages=max_pages, verbose=verbose):
+            container.extend(page.get('results') or ())
 
         return container
 
     async def get_full_range_aggregates(self, fn, symbol: str, time_chunks: list, run_parallel: bool = True,
-                                        max_concurrent_workers: int = os.cpu_count() * 5, warnings: bool = True,
+                                        max_concurrent_workers: int = None, warnings: bool = True,
                                         adjusted: bool = True, sort='asc', limit: int = 5000,
                                         multiplier: int = 1, timespan='day') -> list:
         """
@@ -848,11 +916,15 @@ class BaseAsyncClient(Base):
         if run_parallel:
             import asyncio
 
+            if max_concurrent_workers is None:  # resolved per call so the live cpu count is respected
+                max_concurrent_workers = (os.cpu_count() or 1) * 5
+
             sort_order = self._change_enum(sort)
             futures, semaphore = [], asyncio.Semaphore(max_concurrent_workers)
+            _nd = self.normalize_datetime
 
             for chunk in time_chunks:
-                chunk = (self.normalize_datetime(chunk[0], 'nts'), self.normalize_datetime(chunk[1], 'nts', _dir='end'))
+                chunk = (_nd(chunk[0], 'nts'), _nd(chunk[1], 'nts', _dir='end'))
 
                 futures.append(self.aw_task(fn(symbol, chunk[0], chunk[1], adjusted=adjusted, sort='asc',
                                                limit=500000, multiplier=multiplier, timespan=timespan,
@@ -1,3 +1,3 @@
-from .options import (OptionsClient, build_option_symbol, parse_option_symbol, OptionSymbol,
+from .options import (OptionsClient, build_option_symbol, parse_option_symbol, parse_option_symbols, OptionSymbol,
                       build_option_symbol_for_tda, parse_option_symbol_from_tda, convert_from_polygon_to_tda_format,
                       convert_from_tda_to_polygon_format)
@@ -1,12 +1,38 @@
 # ========================================================= #
 from .. import base_client
 from typing import Union
-from os import cpu_count
+from functools import lru_cache
+from string import ascii_uppercase
 import datetime
-try:
-    import orjson as json_lib
-except ImportError:
-    import json as json_lib
+import os
+import re
+import sys
+
+
+# ========================================================= #
+
+
+# accepted spellings for option type. Anything not in here (after lower-casing) is treated as a put
+_CALL_OR_PUT = {'c': 'C', 'C': 'C', 'call': 'C', 'Call': 'C', 'CALL': 'C'}
+
+# accepted values for output_format in the parse functions
+_LIST_FORMATS = frozenset(('list', list))
+_DICT_FORMATS = frozenset(('dict', dict))
+
+# accepted values for expiry_format which ask for a YYYY-MM-DD string
+_STRING_FORMATS = frozenset(('string', 'str', str))
+
+# optional prefix, underlying (digits allowed for the Corrections), YYMMDD, C/P and the 8 digit strike
+_POLYGON_SYMBOL_RE = re.compile(r'(?:O:)?[A-Z][A-Z0-9.]*\d{6}[CP]\d{8}')
+
+# shorthand timespan values accepted by the aggregates endpoint
+_TIMESPAN_ALIAS = {'min': 'minute'}
+
+# option symbols only carry a 2 digit year. the century is taken from the current date, once
+_CENTURY = datetime.date.today().year // 100 * 100
+
+# deletes digits from underlying symbols. see the Corrections note in _split_polygon_symbol
+_DIGIT_DEL = str.maketrans('', '', '0123456789')
 
 
 # ========================================================= #
@@ -31,24 +57,31 @@ def build_option_symbol(underlying_symbol: str, expiry, call_or_put, strike_pric
     :return: The option symbol in the format specified by polygon
     """
 
-    if isinstance(expiry, (datetime.datetime, datetime.date)):
-        expiry = expiry.strftime('%y%m%d')
+    if isinstance(expiry, datetime.datetime):
+        expiry = _format_expiry_polygon(expiry.date())
+
+    elif isinstance(expiry, datetime.date):
+        expiry = _format_expiry_polygon(expiry)
 
     elif isinstance(expiry, str) and len(expiry) != 6:
         raise ValueError('Expiry string must have 6 characters. Format is: YYMMDD')
 
-    call_or_put = 'C' if call_or_put.lower() in ['c', 'call'] else 'P'
+    call_or_put = _CALL_OR_PUT.get(call_or_put) or _CALL_OR_PUT.get(call_or_put.lower(), 'P')
 
-    if '.' in str(strike_price):
-        strike, strike_dec = str(strike_price).split('.')[0].rjust(5, '0'), str(
-            strike_price).split('.')[1].ljust(3, '0')[:3]
+    if isinstance(strike_price, int):  # whole dollar strikes don't need any string handling
+        strike, strike_dec = f'{strike_price:05d}', '000'
     else:
-        strike, strike_dec = str(int(strike_price)).rjust(5, '0'), '000'
+        head, sep, tail = str(strike_price).partition('.')
+
+        # lstrip drops any zero padding the caller already applied, so the strike is always exactly 5 digits
+        if sep:
+            strike, strike_dec = head.lstrip('0').zfill(5), (tail + '000')[:3]
+        else:
+            strike, strike_dec = (head.lstrip('0') if head.isdigit() else str(int(strike_price))).zfill(5), '000'
 
-    if prefix_o:
-        return f'O:{underlying_symbol.upper()}{expiry}{call_or_put}{strike}{strike_dec}'
+    _symbol = f'{underlying_symbol.upper()}{expiry}{call_or_put}{strike}{strike_dec}'
 
-    return f'{underlying_symbol.upper()}{expiry}{call_or_put}{strike}{strike_dec}'
+    return 'O:' + _symbol if prefix_o else _symbol
 
 
 def parse_option_symbol(option_symbol: str, output_format='object', expiry_format='date'):
@@ -59,22 +92,55 @@ def parse_option_symbol(option_symbol: str, output_format='object', expiry_forma
     :param output_format: Output format of the result. defaults to object. Set it to ``dict`` or ``list`` as needed.
     :param expiry_format: The format for the expiry date in the results. Defaults to ``date`` object. change this
                           param to ``string`` to get the value as a string: ``YYYY-MM-DD``
-    :return: The parsed values either as an object, list or a dict as indicated by ``output_format``.
+    :return: The parsed values either as an object, list or a dict as indicated by ``output_format``. Parsed objects
+             are cached and shared between calls for the same symbol, so treat them as read-only.
     """
 
-    _obj = OptionSymbol(option_symbol, expiry_format)
+    return _format_parsed_symbol(_cached_option_symbol(option_symbol, expiry_format), output_format)
 
-    if output_format in ['list', list]:
-        _obj = [_obj.underlying_symbol, _obj.expiry, _obj.call_or_put, _obj.strike_price, _obj.option_symbol]
 
-    elif output_format in ['dict', dict]:
-        _obj = {'underlying_symbol': _obj.underlying_symbol,
-                'strike_price': _obj.strike_price,
-                'expiry': _obj.expiry,
-                'call_or_put': _obj.call_or_put,
-                'option_symbol': _obj.option_symbol}
+def parse_option_symbols(symbols, expiry_format='date'):
+    """
+    Parse many polygon option symbols at once. Instead of creating one ``OptionSymbol`` per symbol, the symbols are
+    split with vectorized ``pandas`` string operations. This is a lot faster when you have a whole chain or a
+    trades/quotes feed worth of symbols. Requires ``pandas`` to be installed.
+
+    :param symbols: An iterable of option symbols (eg a list or a ``pandas.Series``). Symbols may or may not have the
+                    prefix ``O:``
+    :param expiry_format: The format for the expiry column. Defaults to ``date`` which gives a ``datetime64`` column.
+                          change this param to ``string`` to get the values as strings: ``YYYY-MM-DD``
+    :return: A ``pandas.DataFrame`` having the columns ``underlying_symbol``, ``expiry``, ``call_or_put``,
+             ``strike_price`` and ``option_symbol``. one row per symbol, in the same order.
+    """
 
-    return _obj
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError('pandas is required for parse_option_symbols. Install it using: '
+                          'pip install polygon[\'pandas\']') from None
+
+    symbols = pd.Series(list(symbols), dtype=object).str.replace(r'^O:', '', regex=True)
+
+    # fixed width tail: YYMMDD + C/P + 8 digit strike
+    _tail = symbols.str[-15:]
+
+    # optional filter for those Corrections Ian talked about
+    _underlying = symbols.str[:-15].str.replace(r'\d', '', regex=True)
+
+    # one integer conversion for the whole YYMMDD block. year/month/day are then plain integer column arithmetic
+    _yymmdd = _tail.str[:6].astype('int64')
+    _expiry = pd.to_datetime(pd.DataFrame({'year': _yymmdd // 10000 + _CENTURY,
+                                           'month': _yymmdd // 100 % 100,
+                                           'day': _yymmdd % 100}))
+
+    if expiry_format in _STRING_FORMATS:
+        _expiry = _expiry.dt.strftime('%Y-%m-%d')
+
+    return pd.DataFrame({'underlying_symbol': _underlying,
+                         'expiry': _expiry,
+                         'call_or_put': _tail.str[6].str.upper(),
+                         'strike_price': _tail.str[7:].astype('int64') / 1000,
+                         'option_symbol': _underlying + _tail})
 
 
 def build_option_symbol_for_tda(underlying_symbol: str, expiry, call_or_put, strike_price,
@@ -96,12 +162,18 @@ def build_option_symbol_for_tda(underlying_symbol: str, expiry, call_or_put, str
     :return: The option symbol built in the format supported by TD Ameritrade.
     """
 
-    if isinstance(expiry, (datetime.date, datetime.datetime)):
-        expiry = expiry.strftime('%m%d%y')
+    if isinstance(expiry, datetime.datetime):
+        expiry = _format_expiry_tda(expiry.date())
+
+    elif isinstance(expiry, datetime.date):
+        expiry = _format_expiry_tda(expiry)
 
-    call_or_put = 'C' if call_or_put.lower() in ['c', 'call'] else 'P'
+    call_or_put = _CALL_OR_PUT.get(call_or_put) or _CALL_OR_PUT.get(call_or_put.lower(), 'P')
 
-    strike_price = int(float(strike_price)) if int(float(strike_price)) == float(strike_price) else strike_price
+    if not isinstance(strike_price, int):  # whole number strikes are written without the decimal part
+        _float_strike = float(strike_price)
+        _int_strike = int(_float_strike)
+        strike_price = _int_strike if _int_strike == _float_strike else strike_price
 
     if format_ == 'dot':
         return f'.{underlying_symbol}{expiry}{call_or_put}{strike_price}'
@@ -117,26 +189,17 @@ def parse_option_symbol_from_tda(option_symbol: str, output_format='object', exp
     :param output_format: Output format of the result. defaults to object. Set it to ``dict`` or ``list`` as needed.
     :param expiry_format: The format for the expiry date in the results. Defaults to ``date`` object. change this
                           param to ``string`` to get the value as a string: ``YYYY-MM-DD``
-    :return: The parsed values either as an object, list or a dict as indicated by ``output_format``.
+    :return: The parsed values either as an object, list or a dict as indicated by ``output_format``. Parsed objects
+             are cached and shared between calls for the same symbol, so treat them as read-only.
     """
 
     format_ = 'underscore'
     if option_symbol.startswith('.'):
         format_ = 'dot'
 
-    _obj = OptionSymbol(option_symbol, expiry_format, symbol_format='tda', fmt=format_)
+    _obj = _cached_option_symbol(option_symbol, expiry_format, 'tda', format_)
 
-    if output_format in ['list', list]:
-        _obj = [_obj.underlying_symbol, _obj.expiry, _obj.call_or_put, _obj.strike_price, _obj.option_symbol]
-
-    elif output_format in ['dict', dict]:
-        _obj = {'underlying_symbol': _obj.underlying_symbol,
-                'strike_price': _obj.strike_price,
-                'expiry': _obj.expiry,
-                'call_or_put': _obj.call_or_put,
-                'option_symbol': _obj.option_symbol}
-
-    return _obj
+    return _format_parsed_symbol(_obj, output_format)
 
 
 def convert_from_tda_to_polygon_format(option_symbol: str, prefix_o: bool = False):
@@ -153,10 +216,10 @@ def convert_from_tda_to_polygon_format(option_symbol: str, prefix_o: bool = Fals
     if option_symbol.startswith('.'):
         format_ = 'dot'
 
-    _temp = OptionSymbol(option_symbol, symbol_format='tda', fmt=format_)
+    _underlying, _expiry, _call_or_put, _strike, _ = _split_tda_symbol(option_symbol, format_)
 
-    return build_option_symbol(_temp.underlying_symbol, _temp.expiry, _temp.call_or_put, _temp.strike_price,
-                               prefix_o=prefix_o)
+    # building the date also rejects invalid expiries with a ValueError
+    return build_option_symbol(_underlying, _expiry_from_mmddyy(_expiry), _call_or_put, _strike, prefix_o=prefix_o)
 
 
 def convert_from_polygon_to_tda_format(option_symbol: str, format_: str = 'underscore'):
@@ -171,9 +234,10 @@ def convert_from_polygon_to_tda_format(option_symbol: str, format_: str = 'under
     :return: The formatted symbol converted to TDA symbol format.
     """
 
-    _temp = OptionSymbol(option_symbol)
+    _underlying, _expiry, _call_or_put, _strike, _ = _split_polygon_symbol(option_symbol)
 
-    return build_option_symbol_for_tda(_temp.underlying_symbol, _temp.expiry, _temp.call_or_put, _temp.strike_price,
+    # building the date also rejects invalid expiries with a ValueError
+    return build_option_symbol_for_tda(_underlying, _expiry_from_yymmdd(_expiry), _call_or_put, _strike,
                                        format_=format_)
 
 
@@ -185,10 +249,14 @@ def detect_symbol_format(option_symbol: str) -> Union[str, bool]:
     :param option_symbol: The option symbol to check.
     :return: ``tda`` or ``polygon`` if format is recognized. ``False`` otherwise.
     """
-    if option_symbol.startswith('.') or ('_' in option_symbol):
+    # prefixed polygon symbols are the most common input. no need to scan them for an underscore
+    if option_symbol.startswith('O:'):
+        return 'polygon'
+
+    if option_symbol[:1] == '.' or '_' in option_symbol:
         return 'tda'
 
-    if option_symbol.startswith('O:') or len(option_symbol) > 15:
+    if len(option_symbol) > 15:
         return 'polygon'
 
     return False
@@ -292,21 +360,21 @@ class SyncOptionsClient(base_client.BaseClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        timestamp = self.normalize_datetime(timestamp, output_type='nts', unit='ns')
-
-        timestamp_lt = self.normalize_datetime(timestamp_lt, output_type='nts', unit='ns')
-
-        timestamp_lte = self.normalize_datetime(timestamp_lte, output_type='nts', unit='ns')
-
-        timestamp_gt = self.normalize_datetime(timestamp_gt, output_type='nts', unit='ns')
+        _nd = self.normalize_datetime
 
-        timestamp_gte = self.normalize_datetime(timestamp_gte, output_type='nts', unit='ns')
+        timestamp = _nd(timestamp, 'nts', unit='ns') if timestamp is not None else None
+        timestamp_lt = _nd(timestamp_lt, 'nts', unit='ns') if timestamp_lt is not None else None
+        timestamp_lte = _nd(timestamp_lte, 'nts', unit='ns') if timestamp_lte is not None else None
+        timestamp_gt = _nd(timestamp_gt, 'nts', unit='ns') if timestamp_gt is not None else None
+        timestamp_gte = _nd(timestamp_gte, 'nts', unit='ns') if timestamp_gte is not None else None
 
         _path = f'/v3/trades/{ensure_prefix(option_symbol)}'
 
-        _data = {'timestamp': timestamp, 'timestamp.lt': timestamp_lt, 'timestamp.lte': timestamp_lte,
-                 'timestamp.gt': timestamp_gt, 'timestamp.gte': timestamp_gte, 'order': order, 'sort': sort,
-                 'limit': limit}
+        # only send the filters which were actually supplied
+        _data = {key: value for key, value in (('timestamp', timestamp), ('timestamp.lt', timestamp_lt),
+                                               ('timestamp.lte', timestamp_lte), ('timestamp.gt', timestamp_gt),
+                                               ('timestamp.gte', timestamp_gte), ('order', order), ('sort', sort),
+                                               ('limit', limit)) if value is not None}
 
         _res = self._get_response(_path, params=_data)
 
@@ -314,7 +382,7 @@ class SyncOptionsClient(base_client.BaseClient):
             if raw_response:
                 return _res
 
-            return json_lib.loads(_res.text)
+            return self._decode(_res)
 
         return self._paginate(_res, merge_all_pages, max_pages, verbose=verbose,
                               raw_page_responses=raw_page_responses)
@@ -366,21 +434,21 @@ class SyncOptionsClient(base_client.BaseClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        timestamp = self.normalize_datetime(timestamp, output_type='nts', unit='ns')
-
-        timestamp_lt = self.normalize_datetime(timestamp_lt, output_type='nts', unit='ns')
-
-        timestamp_lte = self.normalize_datetime(timestamp_lte, output_type='nts', unit='ns')
-
-        timestamp_gt = self.normalize_datetime(timestamp_gt, output_type='nts', unit='ns')
+        _nd = self.normalize_datetime
 
-        timestamp_gte = self.normalize_datetime(timestamp_gte, output_type='nts', unit='ns')
+        timestamp = _nd(timestamp, 'nts', unit='ns') if timestamp is not None else None
+        timestamp_lt = _nd(timestamp_lt, 'nts', unit='ns') if timestamp_lt is not None else None
+        timestamp_lte = _nd(timestamp_lte, 'nts', unit='ns') if timestamp_lte is not None else None
+        timestamp_gt = _nd(timestamp_gt, 'nts', unit='ns') if timestamp_gt is not None else None
+        timestamp_gte = _nd(timestamp_gte, 'nts', unit='ns') if timestamp_gte is not None else None
 
         _path = f'/v3/quotes/{ensure_prefix(option_symbol)}'
 
-        _data = {'timestamp': timestamp, 'timestamp.lt': timestamp_lt, 'timestamp.lte': timestamp_lte,
-                 'timestamp.gt': timestamp_gt, 'timestamp.gte': timestamp_gte, 'order': order, 'sort': sort,
-                 'limit': limit}
+        # only send the filters which were actually supplied
+        _data = {key: value for key, value in (('timestamp', timestamp), ('timestamp.lt', timestamp_lt),
+                                               ('timestamp.lte', timestamp_lte), ('timestamp.gt', timestamp_gt),
+                                               ('timestamp.gte', timestamp_gte), ('order', order), ('sort', sort),
+                                               ('limit', limit)) if value is not None}
 
         _res = self._get_response(_path, params=_data)
 
@@ -388,7 +456,7 @@ class SyncOptionsClient(base_client.BaseClient):
             if raw_response:
                 return _res
 
-            return json_lib.loads(_res.text)
+            return self._decode(_res)
 
         return self._paginate(_res, merge_all_pages, max_pages, verbose=verbose,
                               raw_page_responses=raw_page_responses)
@@ -412,7 +480,7 @@ class SyncOptionsClient(base_client.BaseClient):
         if raw_response:
             return _res
 
-        return json_lib.loads(_res.text)
+        return self._decode(_res)
 
     def get_daily_open_close(self, symbol: str, date, adjusted: bool = True,
                              raw_response: bool = False):
@@ -443,11 +511,11 @@ class SyncOptionsClient(base_client.BaseClient):
         if raw_response:
             return _res
 
-        return json_lib.loads(_res.text)
+        return self._decode(_res)
 
     def get_aggregate_bars(self, symbol: str, from_date, to_date, adjusted: bool = True,
                            sort='asc', limit: int = 5000, multiplier: int = 1, timespan='day', full_range: bool = False,
-                           run_parallel: bool = True, max_concurrent_workers: int = cpu_count() * 5,
+                           run_parallel: bool = True, max_concurrent_workers: int = None,
                            warnings: bool = True, high_volatility: bool = False, raw_response: bool = False):
         """
         Get aggregate bars for an option contract over a given date range in custom time window sizes.
@@ -489,18 +557,17 @@ class SyncOptionsClient(base_client.BaseClient):
                  If ``full_range=True``, will return a single list with all the candles in it.
         """
 
+        # normalized once here so the full range chunks all receive plain values
+        timespan = self._change_enum(_TIMESPAN_ALIAS.get(timespan, timespan), str)
+        sort = self._change_enum(sort, str)
+
         if not full_range:
 
             from_date = self.normalize_datetime(from_date, output_type='nts')
 
             to_date = self.normalize_datetime(to_date, output_type='nts', _dir='end')
 
-            if timespan == 'min':
-                timespan = 'minute'
-
-            timespan, sort = self._change_enum(timespan, str), self._change_enum(sort, str)
-
-            _path = f'/v2/aggs/ticker/{ensure_prefix(symbol).upper()}/range/{multiplier}/{timespan}/{from_date}/' \
+            _path = f'/v2/aggs/ticker/{ensure_prefix(symbol)}/range/{multiplier}/{timespan}/{from_date}/' \
                     f'{to_date}'
 
             _data = {'adjusted': 'true' if adjusted else 'false',
@@ -512,7 +579,7 @@ class SyncOptionsClient(base_client.BaseClient):
             if raw_response:
                 return _res
 
-            return json_lib.loads(_res.text)
+            return self._decode(_res)
 
         # The full range agg begins
         if run_parallel:  # Parallel Run
@@ -565,7 +632,7 @@ class SyncOptionsClient(base_client.BaseClient):
             if raw_response:
                 return _res
 
-            return json_lib.loads(_res.text)
+            return self._decode(_res)
 
         return self._paginate(_res, merge_all_pages, max_pages, verbose=verbose,
                               raw_page_responses=raw_page_responses)
@@ -594,7 +661,7 @@ class SyncOptionsClient(base_client.BaseClient):
         if raw_response:
             return _res
 
-        return json_lib.loads(_res.text)
+        return self._decode(_res)
 
 
 # ========================================================= #
@@ -663,21 +730,21 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        timestamp = self.normalize_datetime(timestamp, output_type='nts', unit='ns')
-
-        timestamp_lt = self.normalize_datetime(timestamp_lt, output_type='nts', unit='ns')
+        _nd = self.normalize_datetime
 
-        timestamp_lte = self.normalize_datetime(timestamp_lte, output_type='nts', unit='ns')
-
-        timestamp_gt = self.normalize_datetime(timestamp_gt, output_type='nts', unit='ns')
-
-        timestamp_gte = self.normalize_datetime(timestamp_gte, output_type='nts', unit='ns')
+        timestamp = _nd(timestamp, 'nts', unit='ns') if timestamp is not None else None
+        timestamp_lt = _nd(timestamp_lt, 'nts', unit='ns') if timestamp_lt is not None else None
+        timestamp_lte = _nd(timestamp_lte, 'nts', unit='ns') if timestamp_lte is not None else None
+        timestamp_gt = _nd(timestamp_gt, 'nts', unit='ns') if timestamp_gt is not None else None
+        timestamp_gte = _nd(timestamp_gte, 'nts', unit='ns') if timestamp_gte is not None else None
 
         _path = f'/v3/trades/{ensure_prefix(option_symbol)}'
 
-        _data = {'timestamp': timestamp, 'timestamp.lt': timestamp_lt, 'timestamp.lte': timestamp_lte,
-                 'timestamp.gt': timestamp_gt, 'timestamp.gte': timestamp_gte, 'order': order, 'sort': sort,
-                 'limit': limit}
+        # only send the filters which were actually supplied
+        _data = {key: value for key, value in (('timestamp', timestamp), ('timestamp.lt', timestamp_lt),
+                                               ('timestamp.lte', timestamp_lte), ('timestamp.gt', timestamp_gt),
+                                               ('timestamp.gte', timestamp_gte), ('order', order), ('sort', sort),
+                                               ('limit', limit)) if value is not None}
 
         _res = await self._get_response(_path, params=_data)
 
@@ -685,7 +752,7 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
             if raw_response:
                 return _res
 
-            return json_lib.loads(_res.text)
+            return self._decode(_res)
 
         return await self._paginate(_res, merge_all_pages, max_pages, verbose=verbose,
                                     raw_page_responses=raw_page_responses)
@@ -737,21 +804,21 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        timestamp = self.normalize_datetime(timestamp, output_type='nts', unit='ns')
-
-        timestamp_lt = self.normalize_datetime(timestamp_lt, output_type='nts', unit='ns')
+        _nd = self.normalize_datetime
 
-        timestamp_lte = self.normalize_datetime(timestamp_lte, output_type='nts', unit='ns')
-
-        timestamp_gt = self.normalize_datetime(timestamp_gt, output_type='nts', unit='ns')
-
-        timestamp_gte = self.normalize_datetime(timestamp_gte, output_type='nts', unit='ns')
+        timestamp = _nd(timestamp, 'nts', unit='ns') if timestamp is not None else None
+        timestamp_lt = _nd(timestamp_lt, 'nts', unit='ns') if timestamp_lt is not None else None
+        timestamp_lte = _nd(timestamp_lte, 'nts', unit='ns') if timestamp_lte is not None else None
+        timestamp_gt = _nd(timestamp_gt, 'nts', unit='ns') if timestamp_gt is not None else None
+        timestamp_gte = _nd(timestamp_gte, 'nts', unit='ns') if timestamp_gte is not None else None
 
         _path = f'/v3/quotes/{ensure_prefix(option_symbol)}'
 
-        _data = {'timestamp': timestamp, 'timestamp.lt': timestamp_lt, 'timestamp.lte': timestamp_lte,
-                 'timestamp.gt': timestamp_gt, 'timestamp.gte': timestamp_gte, 'order': order, 'sort': sort,
-                 'limit': limit}
+        # only send the filters which were actually supplied
+        _data = {key: value for key, value in (('timestamp', timestamp), ('timestamp.lt', timestamp_lt),
+                                               ('timestamp.lte', timestamp_lte), ('timestamp.gt', timestamp_gt),
+                                               ('timestamp.gte', timestamp_gte), ('order', order), ('sort', sort),
+                                               ('limit', limit)) if value is not None}
 
         _res = await self._get_response(_path, params=_data)
 
@@ -759,7 +826,7 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
             if raw_response:
                 return _res
 
-            return json_lib.loads(_res.text)
+            return self._decode(_res)
 
         return await self._paginate(_res, merge_all_pages, max_pages, verbose=verbose,
                                     raw_page_responses=raw_page_responses)
@@ -783,7 +850,7 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
         if raw_response:
             return _res
 
-        return json_lib.loads(_res.text)
+        return self._decode(_res)
 
     async def get_daily_open_close(self, symbol: str, date, adjusted: bool = True,
                                    raw_response: bool = False):
@@ -814,12 +881,12 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
         if raw_response:
             return _res
 
-        return json_lib.loads(_res.text)
+        return self._decode(_res)
 
     async def get_aggregate_bars(self, symbol: str, from_date, to_date, adjusted: bool = True,
                                  sort='asc', limit: int = 5000, multiplier: int = 1, timespan='day',
                                  full_range: bool = False, run_parallel: bool = True,
-                                 max_concurrent_workers: int = cpu_count() * 5, warnings: bool = True,
+                                 max_concurrent_workers: int = None, warnings: bool = True,
                                  high_volatility: bool = False, raw_response: bool = False):
         """
         Get aggregate bars for an option contract over a given date range in custom time window sizes.
@@ -861,18 +928,17 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
                  If ``full_range=True``, will return a single list with all the candles in it.
         """
 
+        # normalized once here so the full range chunks all receive plain values
+        timespan = self._change_enum(_TIMESPAN_ALIAS.get(timespan, timespan), str)
+        sort = self._change_enum(sort, str)
+
         if not full_range:
 
             from_date = self.normalize_datetime(from_date, output_type='nts')
 
             to_date = self.normalize_datetime(to_date, output_type='nts', _dir='end')
 
-            if timespan == 'min':
-                timespan = 'minute'
-
-            timespan, sort = self._change_enum(timespan, str), self._change_enum(sort, str)
-
-            _path = f'/v2/aggs/ticker/{ensure_prefix(symbol).upper()}/range/{multiplier}/{timespan}/{from_date}/' \
+            _path = f'/v2/aggs/ticker/{ensure_prefix(symbol)}/range/{multiplier}/{timespan}/{from_date}/' \
                     f'{to_date}'
 
             _data = {'adjusted': 'true' if adjusted else 'false',
@@ -884,7 +950,7 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
             if raw_response:
                 return _res
 
-            return json_lib.loads(_res.text)
+            return self._decode(_res)
 
         # The full range agg begins
         if run_parallel:  # Parallel Run
@@ -901,6 +967,28 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
                                                     multiplier=multiplier, sort=sort, limit=limit,
                                                     timespan=timespan)
 
+    async def get_aggregate_bars_bulk(self, queries: list, max_concurrent_workers: int = None) -> list:
+        """
+        Get aggregate bars for many option contracts concurrently. Each query is dispatched as a separate
+        :meth:`get_aggregate_bars` call on this client's connection pool, with at most ``max_concurrent_workers`` of
+        them in flight at a time. This method should be awaited as this is a coroutine.
+
+        :param queries: A list of dicts. Each dict holds the keyword arguments for one :meth:`get_aggregate_bars`
+                        call. eg ``{'symbol': 'TSLA211015P00125000', 'from_date': '2021-09-10',
+                        'to_date': '2021-10-01'}``
+        :param max_concurrent_workers: How many of the queries are allowed to run at once. Defaults to ``your cpu core
+                                       count * 5``
+        :return: A list holding the result of each query, in the same order as ``queries``
+        """
+        import asyncio
+
+        if max_concurrent_workers is None:
+            max_concurrent_workers = (os.cpu_count() or 1) * 5
+
+        semaphore = asyncio.Semaphore(max_concurrent_workers)
+
+        return await asyncio.gather(*[self.aw_task(self.get_aggregate_bars(**query), semaphore) for query in queries])
+
     async def get_snapshot(self, underlying_symbol: str, option_symbol: str, all_pages: bool = False,
                            max_pages: int = None, merge_all_pages: bool = True, verbose: bool = False,
                            raw_page_responses: bool = False, raw_response: bool = False):
@@ -939,7 +1027,7 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
             if raw_response:
                 return _res
 
-            return json_lib.loads(_res.text)
+            return self._decode(_res)
 
         return await self._paginate(_res, merge_all_pages, max_pages, verbose=verbose,
                                     raw_page_responses=raw_page_responses)
@@ -968,7 +1056,7 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
         if raw_response:
             return _res
 
-        return json_lib.loads(_res.text)
+        return self._decode(_res)
 
 
 # ========================================================= #
@@ -978,6 +1066,7 @@ class OptionSymbol:
     """
     The custom object for parsed details from option symbols.
     """
+    __slots__ = ('underlying_symbol', '_expiry', 'expiry', 'call_or_put', 'strike_price', 'option_symbol')
 
     def __init__(self, option_symbol: str, expiry_format='date', symbol_format='polygon', fmt: str = 'underscore'):
         """
@@ -994,83 +1083,180 @@ class OptionSymbol:
                     ``'dot'`` to get dot format. (ONLY use when using tda formats, has no effect on polygon format)
         """
         if symbol_format == 'polygon':
-            if option_symbol.startswith('O:'):
-                option_symbol = option_symbol[2:]
+            _underlying, self._expiry, self.call_or_put, self.strike_price, self.option_symbol = \
+                _split_polygon_symbol(option_symbol)
 
-            self.underlying_symbol = option_symbol[:-15]
+            # a chain has thousands of contracts on a handful of underlyings. interning keeps one copy of each
+            self.underlying_symbol = sys.intern(_underlying)
+            self.expiry = _expiry_from_yymmdd(self._expiry)
 
-            _len = len(self.underlying_symbol)
+            if expiry_format in _STRING_FORMATS:
+                self.expiry = self.expiry.isoformat()  # YYYY-MM-DD, without going through strftime
 
-            # optional filter for those Corrections Ian talked about
-            self.underlying_symbol = ''.join([x for x in self.underlying_symbol if not x.isdigit()])
+        elif symbol_format == 'tda':
+            _underlying, self._expiry, self.call_or_put, _strike, self.option_symbol = \
+                _split_tda_symbol(option_symbol, fmt)
 
-            self._expiry = option_symbol[_len:_len + 6]
+            self.underlying_symbol = sys.intern(_underlying)
 
-            self.expiry = datetime.date(int(datetime.date.today().strftime('%Y')[:2] + self._expiry[:2]),
-                                        int(self._expiry[2:4]), int(self._expiry[4:6]))
+            self.expiry = _expiry_from_mmddyy(self._expiry)
 
-            self.call_or_put = option_symbol[_len + 6].upper()
+            _float_strike = float(_strike)
+            _int_strike = int(_float_strike)
+            self.strike_price = _int_strike if _int_strike == _float_strike else _float_strike
 
-            self.strike_price = int(option_symbol[_len + 7:]) / 1000
+            if expiry_format in _STRING_FORMATS:
+                self.expiry = self.expiry.isoformat()
 
-            self.option_symbol = f'{self.underlying_symbol}{option_symbol[_len:]}'
+    def __repr__(self):
+        return f'Underlying: {self.underlying_symbol} || expiry: {self.expiry} || type: {self.call_or_put} || ' \
+               f'strike_price: {self.strike_price}'
 
-            if expiry_format in ['string', 'str', str]:
-                self.expiry = self.expiry.strftime('%Y-%m-%d')
 
-        elif symbol_format == 'tda':
-            if fmt == 'dot':
-                option_symbol, num = option_symbol[1:].upper(), 0
+@lru_cache(maxsize=16384)
+def _cached_option_symbol(option_symbol: str, expiry_format='date', symbol_format='polygon', fmt: str = 'underscore'):
+    """
+    Cached ``OptionSymbol`` construction used by the parse functions. The same contracts show up over and over again
+    in trades/quotes/aggs data, so there is no point parsing them every single time. The returned objects are shared
+    across callers and must not be modified.
+    """
+    return OptionSymbol(option_symbol, expiry_format, symbol_format=symbol_format, fmt=fmt)
 
-                for char in option_symbol:
-                    if char.isalpha():
-                        num += 1
-                        continue
-                    break
 
-                option_symbol = f'{option_symbol[:num]}_{option_symbol[num+2:num+4]}{option_symbol[num+4:num+6]}' \
-                                f'{option_symbol[num:num+2]}{option_symbol[num+6:]}'
+def _format_parsed_symbol(_obj, output_format='object'):
+    """
+    Shape a parsed ``OptionSymbol`` as requested by ``output_format`` in the parse functions. Each attribute is read
+    exactly once.
+    """
+    if output_format in _LIST_FORMATS:
+        return [_obj.underlying_symbol, _obj.expiry, _obj.call_or_put, _obj.strike_price, _obj.option_symbol]
 
-            # Usual flow
-            _split = option_symbol.split('_')
+    if output_format in _DICT_FORMATS:
+        return {'underlying_symbol': _obj.underlying_symbol,
+                'strike_price': _obj.strike_price,
+                'expiry': _obj.expiry,
+                'call_or_put': _obj.call_or_put,
+                'option_symbol': _obj.option_symbol}
 
-            self.underlying_symbol = _split[0]
+    return _obj
 
-            self._expiry = _split[1][:6]
 
-            self.expiry = datetime.date(int(datetime.date.today().strftime('%Y')[:2] + self._expiry[4:6]),
-                                        int(self._expiry[:2]), int(self._expiry[2:4]))
+def _split_polygon_symbol(option_symbol: str) -> tuple:
+    """
+    Split a polygon format option symbol into its raw parts. Used by ``OptionSymbol`` and the format converters, which
+    don't need a full object.
 
-            self.call_or_put = _split[1][6]
+    :param option_symbol: the symbol to split. with or without the prefix ``O:``
+    :return: tuple ``(underlying_symbol, expiry, call_or_put, strike_price, option_symbol)``. expiry is the ``YYMMDD``
+             string from the symbol. option_symbol is the corrected symbol without prefix.
+    """
+    if option_symbol.startswith('O:'):
+        option_symbol = option_symbol[2:]
 
-            self.strike_price = int(float(_split[1][7:])) if float(_split[1][7:]) == int(float(_split[1][7:])) else \
-                float(_split[1][7:])
+    if len(option_symbol) < 15:
+        raise ValueError(f'{option_symbol} is too short to be a polygon option symbol. See documentation on option '
+                         'symbols for more info')
 
-            self.option_symbol = option_symbol
+    underlying_symbol = option_symbol[:-15]
 
-            if expiry_format in ['string', 'str', str]:
-                self.expiry = self.expiry.strftime('%Y-%m-%d')
+    # optional filter for those Corrections Ian talked about
+    if not underlying_symbol.isalpha():
+        underlying_symbol = underlying_symbol.translate(_DIGIT_DEL)
 
-    def __repr__(self):
-        return f'Underlying: {self.underlying_symbol} || expiry: {self.expiry} || type: {self.call_or_put} || ' \
-               f'strike_price: {self.strike_price}'
+    # the tail is fixed width (YYMMDD + C/P + 8 digit strike), so every field sits at a constant offset from the end
+    return (underlying_symbol, option_symbol[-15:-9], option_symbol[-9].upper(), int(option_symbol[-8:]) / 1000,
+            f'{underlying_symbol}{option_symbol[-15:]}')
+
+
+def _split_tda_symbol(option_symbol: str, fmt: str = 'underscore') -> tuple:
+    """
+    Split a TD Ameritrade format option symbol into its raw parts. Used by ``OptionSymbol`` and the format
+    converters, which don't need a full object.
+
+    :param option_symbol: the symbol to split.
+    :param fmt: ``underscore`` or ``dot``. see ``OptionSymbol`` for details.
+    :return: tuple ``(underlying_symbol, expiry, call_or_put, strike_price, option_symbol)``. expiry is the ``MMDDYY``
+             string and strike_price is the string exactly as it appears in the symbol. option_symbol is the symbol in
+             underscore format.
+    """
+    if fmt == 'dot':
+        option_symbol = option_symbol[1:].upper()
+
+        # length of the leading underlying symbol. lstrip does the scan in C
+        num = len(option_symbol) - len(option_symbol.lstrip(ascii_uppercase))
+
+        option_symbol = f'{option_symbol[:num]}_{option_symbol[num+2:num+4]}{option_symbol[num+4:num+6]}' \
+                        f'{option_symbol[num:num+2]}{option_symbol[num+6:]}'
+
+    # Usual flow
+    _split = option_symbol.split('_')
+
+    # needs the underlying and at least MMDDYY, C/P and one strike digit after the underscore
+    if len(_split) != 2 or len(_split[1]) < 8:
+        raise ValueError(f'{option_symbol} is not a valid TDA option symbol. See documentation on option symbols for '
+                         'more info')
+
+    return _split[0], _split[1][:6], _split[1][6], _split[1][7:], option_symbol
 
 
-def ensure_prefix(symbol: str):
+@lru_cache(maxsize=512)
+def _format_expiry_polygon(expiry: datetime.date) -> str:
+    """
+    Format an expiry date as ``YYMMDD``. Cached since a whole chain of strikes usually shares a handful of expiries.
+    """
+    return f'{expiry.year % 100:02d}{expiry.month:02d}{expiry.day:02d}'
+
+
+@lru_cache(maxsize=512)
+def _format_expiry_tda(expiry: datetime.date) -> str:
+    """
+    Format an expiry date as ``MMDDYY``. Cached since a whole chain of strikes usually shares a handful of expiries.
+    """
+    return f'{expiry.month:02d}{expiry.day:02d}{expiry.year % 100:02d}'
+
+
+def _expiry_from_yymmdd(expiry: str) -> datetime.date:
+    """
+    Build the expiry date from the ``YYMMDD`` part of a polygon symbol. Raises ``ValueError`` on an invalid date.
+    """
+    _yymmdd = int(expiry)
+
+    return datetime.date(_CENTURY + _yymmdd // 10000, _yymmdd // 100 % 100, _yymmdd % 100)
+
+
+def _expiry_from_mmddyy(expiry: str) -> datetime.date:
+    """
+    Build the expiry date from the ``MMDDYY`` part of a tda symbol. Raises ``ValueError`` on an invalid date.
+    """
+    _mmddyy = int(expiry)
+
+    return datetime.date(_CENTURY + _mmddyy % 100, _mmddyy // 10000, _mmddyy // 100 % 100)
+
+
+@lru_cache(maxsize=4096)
+def ensure_prefix(symbol: str, validate: bool = False):
     """
     Ensure that the option symbol has the prefix ``O:`` as needed by polygon endpoints. If it does, make no changes. If
-    it doesn't, add the prefix and return the new value.
+    it doesn't, add the prefix and return the new value. The returned value is always upper cased. Results are cached
+    since the same symbol is usually requested many times (e.g. each chunk of a full range aggregate call).
 
     :param symbol: the option symbol to check
+    :param validate: Set to ``True`` to also check that the symbol is a well formed polygon option symbol, raising a
+                     ``ValueError`` if it isn't. Defaults to False which only checks the length, as the endpoint
+                     methods do.
     """
     if len(symbol) < 15:
         raise ValueError('Option symbol length must at least be 15 letters. See documentation on option symbols for '
                          'more info')
 
-    if symbol.upper().startswith('O:'):
-        return symbol.upper()
+    if not symbol.isupper():  # symbols almost always come in upper case already. skip the copy then
+        symbol = symbol.upper()
+
+    if validate and not _POLYGON_SYMBOL_RE.fullmatch(symbol):
+        raise ValueError(f'{symbol} is not a valid polygon option symbol. See documentation on option symbols for '
+                         'more info')
 
-    return f'O:{symbol.upper()}'
+    return symbol if symbol.startswith('O:') else f'O:{symbol}'
 
 
 # ========================================================= #
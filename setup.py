@@ -37,6 +37,7 @@ setup(
         'httpx'],
     extras_require={'uvloop': ['uvloop'], 
                     'orjson': ['orjson'], 
-                    'all': ['orjson', 'uvloop']},
+                    'pandas': ['pandas'],
+                    'all': ['orjson', 'uvloop', 'pandas']},
     keywords='finance trading equities bonds options research data',
 )
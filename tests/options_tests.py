@@ -44,6 +44,18 @@ class TestOptionsPrefix(unittest.TestCase):
         self.assertEqual(data4, 'O:TSLA120110P00123000')
         self.assertEqual(data5, 'O:TSLA120110P00123000')
 
+        self.assertEqual(func('tsla120110c00123000', validate=True), 'O:TSLA120110C00123000')
+        self.assertEqual(func('O:AMD1211205P00149000', validate=True), 'O:AMD1211205P00149000')
+
+        with self.assertRaises(ValueError):
+            func('TSLA120110X00123000', validate=True)
+
+        with self.assertRaises(ValueError):
+            func('TSLA_120110C123000', validate=True)
+
+        with self.assertRaises(ValueError):
+            func('O:TSLA211015C00150500\n', validate=True)
+
 
 # ========================================================= #
 
@@ -64,6 +76,10 @@ class TestOptions(unittest.TestCase):
         self.assertEqual(bos4, 'WPGGQ211205C00134000')
         self.assertEqual(bos5, 'PPPPPP211205P00134345')
 
+        # already zero padded strings must not widen the strike field
+        self.assertEqual(polygon.build_option_symbol('tsla', '211015', 'c', '000150'), 'TSLA211015C00150000')
+        self.assertEqual(polygon.build_option_symbol('tsla', '211015', 'c', '000150.5'), 'TSLA211015C00150500')
+
     def test_parse_option_symbol(self):
         bos = polygon.parse_option_symbol('O:A211015C00090000')  
         bos2 = polygon.parse_option_symbol('O:AA211015C00013000', expiry_format=str)  
@@ -107,6 +123,28 @@ class TestOptions(unittest.TestCase):
                                 'call_or_put': 'C',
                                 'option_symbol': 'NVDA211015C00072500'})
 
+    def test_parse_option_symbols(self):
+        symbols = ['O:A211015C00090000', 'AA211015P00015000', 'AMD211015P00037500', 'GOOGL2211015P00780000']
+
+        df = polygon.parse_option_symbols(symbols)
+        df2 = polygon.parse_option_symbols(symbols, expiry_format=str)
+
+        _dt = int(dt.date.today().strftime('%Y')[:2] + '21')
+
+        self.assertEqual(len(df), 4)
+        self.assertEqual(list(df.columns), ['underlying_symbol', 'expiry', 'call_or_put', 'strike_price',
+                                            'option_symbol'])
+        self.assertEqual(list(df['underlying_symbol']), ['A', 'AA', 'AMD', 'GOOGL'])
+        self.assertEqual(list(df['call_or_put']), ['C', 'P', 'P', 'P'])
+        self.assertEqual(list(df['strike_price']), [90, 15, 37.5, 780])
+        self.assertEqual(list(df['option_symbol']), ['A211015C00090000', 'AA211015P00015000', 'AMD211015P00037500',
+                                                     'GOOGL211015P00780000'])
+        self.assertEqual(df['expiry'][0].date(), dt.date(_dt, 10, 15))
+        self.assertEqual(list(df2['expiry']), [f'{_dt}-10-15'] * 4)
+
+        for row, symbol in zip(df2.to_dict('records'), symbols):
+            self.assertEqual(row, polygon.parse_option_symbol(symbol, output_format=dict, expiry_format=str))
+
     def test_build_option_symbol_for_tda(self):
         bos = polygon.build_option_symbol_for_tda('X', '120521', 'call', 134)
         bos1 = polygon.build_option_symbol_for_tda('AA', dt.date(2021, 12, 5), 'c', 134.4)
@@ -175,6 +213,12 @@ class TestOptions(unittest.TestCase):
         self.assertEqual(bos7, 'PPPPPP211015P00134345')
         self.assertEqual(bos8, 'X211015P00134020')
 
+        with self.assertRaises(ValueError):
+            polygon.convert_from_tda_to_polygon_format('TSLA_133121C150')
+
+        with self.assertRaises(ValueError):
+            polygon.convert_from_tda_to_polygon_format('TSLA_1015')
+
     def test_convert_from_polygon_to_tda_format(self):
         bos1 = polygon.convert_from_polygon_to_tda_format('X211015C00134000')
         bos2 = polygon.convert_from_polygon_to_tda_format('O:AA211015C00134400')
@@ -194,6 +238,12 @@ class TestOptions(unittest.TestCase):
         self.assertEqual(bos7, '.PPPPPP101521P134.345')
         self.assertEqual(bos8, '.X101521P134')
 
+        with self.assertRaises(ValueError):
+            polygon.convert_from_polygon_to_tda_format('X211315C00090000')
+
+        with self.assertRaises(ValueError):
+            polygon.convert_from_polygon_to_tda_format('TSLA')
+
     def test_get_trades(self):
         with polygon.OptionsClient(cred.KEY) as client:
             data = client.get_trades('O:TSLA210903C00700000', limit=10)
@@ -512,6 +562,23 @@ class TestOptions(unittest.TestCase):
         self.assertIsInstance(data, dict)
         self.assertEqual(data['status'], 'OK')
 
+    @async_test
+    async def test_async_get_aggregate_bars_bulk(self):
+        async with polygon.OptionsClient(cred.KEY, True) as client:
+            data = await client.get_aggregate_bars_bulk([
+                {'symbol': 'O:TSLA210903C00700000', 'from_date': '2021-09-10', 'to_date': dt.date(2021, 10, 1),
+                 'limit': 30},
+                {'symbol': 'TSLA210903C00700000', 'from_date': '2021-06-10', 'to_date': dt.date(2021, 10, 1),
+                 'full_range': True, 'timespan': 'minute', 'warnings': False, 'high_volatility': True}],
+                max_concurrent_workers=2)
+
+            self.assertIsInstance(data, list)
+            self.assertEqual(len(data), 2)
+            self.assertIsInstance(data[0], dict)
+            self.assertEqual(data[0]['status'], 'OK')
+            self.assertIsInstance(data[1], list)
+            self.assertEqual(len(data[1]), 4355)
+
     @async_test
     async def test_async_get_snapshot(self):
         async with polygon.OptionsClient(cred.KEY, True) as client: